@@ -1,14 +1,323 @@
+import asyncio
+import codecs
 import requests
-import json
+import os
+import random
+import re
 import time
-from typing import List, Dict, Optional
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import List, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit
+import aiohttp
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Main-content containers, in priority order: tags, then role="main", then
+# classes. They are matched in a single tree walk via CONTENT_SELECTOR and
+# the highest-priority match is picked afterwards.
+CONTENT_TAGS = ('article', 'main')
+CONTENT_CLASSES = (
+    'content', 'post-content', 'entry-content', 'article-content', 'post-body'
+)
+CONTENT_SELECTOR = ', '.join(
+    [*CONTENT_TAGS, '[role="main"]', *(f'.{cls}' for cls in CONTENT_CLASSES)]
+)
+
+# Anchors that carry an href; matched natively by lexbor's CSS engine
+LINK_SELECTOR = 'a[href]'
+
+# Page metadata; matched document-wide because the HTML5 parser moves
+# <title>/<meta> into <body> once anything not allowed in <head> appears.
+# <svg><title> is a tooltip, not the page title.
+TITLE_SELECTOR = 'title:not(svg title)'
+DESCRIPTION_SELECTOR = 'meta[name="description"]'
+
+# Subtrees dropped before extracting text
+STRIPPED_TAGS = ['script', 'style']
+
+_WS_RE = re.compile(r'\s+')
+_QUERY_OR_FRAGMENT_RE = re.compile(r'[?#]')
+# urlsplit() drops these anywhere in a URL, so hrefs wrapped across lines
+# resolve as if they were written on one
+_URL_STRIPPED_CHARS = str.maketrans('', '', '\t\r\n')
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+# <meta charset=...> and <meta http-equiv="Content-Type" content="...; charset=...">
+_META_CHARSET_RE = re.compile(rb'<meta\s[^>]*?charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Browsers (WHATWG Encoding Standard) decode these labels as windows-1252;
+# keys are codecs.lookup() names
+_WHATWG_ENCODING_ALIASES = {
+    'ascii': 'cp1252',
+    'iso8859-1': 'cp1252',
+}
+
+# hrefs that never point at a crawlable page
+SKIP_HREF_PREFIXES = ('#', 'mailto:', 'tel:', 'javascript:')
+
+# Only the first MAX_BODY_BYTES of a page are downloaded and parsed; the
+# stored content is capped at 5000 characters anyway
+MAX_BODY_BYTES = 2 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Connection limits for concurrent page fetches
+MAX_CONNECTIONS = 10
+MAX_PER_HOST = 2
+
+# Parser processes; a crawl never has more pages in flight than connections
+PARSE_WORKERS = min(MAX_CONNECTIONS, os.cpu_count() or 1)
+
+# Retries for transient fetch failures: up to FETCH_ATTEMPTS tries with full
+# jitter exponential backoff. After HOST_FAILURE_THRESHOLD consecutive
+# failed requests (each counted once, after its retries) a host is backed
+# off for 2**failures seconds (capped) before each further request,
+# instead of piling more connections onto it.
+FETCH_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 8
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+HOST_FAILURE_THRESHOLD = 3
+MAX_HOST_BACKOFF = 30
+
+# Number of crawled pages kept in the in-memory page cache, and how long
+# (seconds) a cached page is served before it is fetched again
+PAGE_CACHE_SIZE = 1024
+PAGE_CACHE_TTL = 60 * 60
+
+# Serper searches arriving within this window are sent as one batch request
+SERPER_BATCH_WINDOW_MS = 10
+SERPER_MAX_BATCH = 20
+SERPER_TIMEOUT = 30
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalise a URL for de-duplication
+    
+    Lowercases the scheme and host, drops the fragment and sorts the
+    query parameters.
+    
+    Args:
+        url (str): URL to normalise
+        
+    Returns:
+        str: Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+
+def _is_html(content_type: str) -> bool:
+    """
+    Check whether a Content-Type header denotes an HTML page
+    
+    Args:
+        content_type (str): Content-Type header value, possibly empty
+        
+    Returns:
+        bool: True for HTML or when the server sent no Content-Type
+    """
+    mime_type = content_type.split(';', 1)[0].strip().lower()
+    return not mime_type or mime_type in HTML_CONTENT_TYPES
+
+
+def _is_transient(error: Exception) -> bool:
+    """
+    Check whether a fetch error is worth retrying
+    
+    Args:
+        error (Exception): Error raised while fetching a page
+        
+    Returns:
+        bool: True for timeouts, connection errors, 429 and 5xx responses
+    """
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+
+def _extract_internal_links(tree: LexborHTMLParser, base_url: str, max_links: int = 10) -> List[str]:
+    """
+    Extract internal links from a webpage
+    
+    Args:
+        tree (LexborHTMLParser): Parsed HTML content
+        base_url (str): Base URL for resolving relative links
+        max_links (int): Maximum number of internal links to extract
+        
+    Returns:
+        List[str]: List of internal links
+    """
+    base_parsed = urlparse(base_url)
+    base_domain = base_parsed.netloc
+    base_origin = f"{base_parsed.scheme}://{base_domain}"
+    same_origin_prefix = base_origin + '/'
+    internal_links = set()
+    seen_hrefs = set()
+    
+    for link in tree.css(LINK_SELECTOR):
+        href = (link.attrs.get('href') or '').strip().translate(_URL_STRIPPED_CHARS)
+        
+        if not href or href.startswith(SKIP_HREF_PREFIXES) or href in seen_hrefs:
+            continue
+        seen_hrefs.add(href)
+        
+        # Root-relative and same-origin absolute links only need their
+        # query/fragment cut off; anything else (relative paths, dot
+        # segments, ;params, other hosts) goes through urljoin/urlparse
+        path = None
+        if href.startswith(same_origin_prefix):
+            path = href[len(base_origin):]
+        elif href.startswith('/') and not href.startswith('//'):
+            path = href
+        if path is not None:
+            path = _QUERY_OR_FRAGMENT_RE.split(path, 1)[0]
+        
+        if path is not None and '/.' not in path and ';' not in path:
+            clean_url = base_origin + path
+        else:
+            parsed_url = urlparse(urljoin(base_url, href))
+            if parsed_url.netloc != base_domain:
+                continue
+            clean_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+        
+        if clean_url != base_url and clean_url not in internal_links:
+            internal_links.add(clean_url)
+            
+            if len(internal_links) >= max_links:
+                break
+    
+    return list(internal_links)
+
+
+def _content_priority(node) -> int:
+    """
+    Rank a node matched by CONTENT_SELECTOR, lower meaning preferred
+    
+    Args:
+        node: Matched element
+        
+    Returns:
+        int: Position of the first content rule the node satisfies
+    """
+    if node.tag in CONTENT_TAGS:
+        return CONTENT_TAGS.index(node.tag)
+    if node.attrs.get('role') == 'main':
+        return len(CONTENT_TAGS)
+    classes = (node.attrs.get('class') or '').split()
+    for i, cls in enumerate(CONTENT_CLASSES):
+        if cls in classes:
+            return len(CONTENT_TAGS) + 1 + i
+    return len(CONTENT_TAGS) + 1 + len(CONTENT_CLASSES)
+
+
+def _decode_body(body: bytes, content_type: str = '') -> Union[bytes, str]:
+    """
+    Prepare a page body for the parser, decoding it at most once
+    
+    lexbor reads raw bytes as UTF-8, so UTF-8 (and unlabelled) pages are
+    passed through untouched. Pages whose Content-Type or <meta> charset
+    names another encoding are decoded to str once, up front, mapping
+    labels the way browsers do (e.g. latin-1 is read as windows-1252).
+    
+    Args:
+        body (bytes): Raw HTML of the page
+        content_type (str): Content-Type header value, possibly empty
+        
+    Returns:
+        Union[bytes, str]: Body to hand to LexborHTMLParser
+    """
+    match = _CHARSET_RE.search(content_type.encode('latin-1', errors='ignore'))
+    from_meta = not match
+    if from_meta:
+        match = _META_CHARSET_RE.search(body[:1024])
+    if not match:
+        return body
+    
+    try:
+        encoding = codecs.lookup(match.group(1).decode('ascii')).name
+    except LookupError:
+        return body
+    encoding = _WHATWG_ENCODING_ALIASES.get(encoding, encoding)
+    # A page that could spell out its <meta> in ASCII is not UTF-16
+    if from_meta and encoding.startswith('utf-16'):
+        encoding = 'utf-8'
+    if encoding == 'utf-8':
+        return body
+    return body.decode(encoding, errors='replace')
+
+
+def _parse_html(body: bytes, url: str, content_type: str = '') -> Dict:
+    """
+    Parse a fetched HTML document into the crawl result
+    
+    Defined at module level so it can be shipped to a worker process.
+    
+    Args:
+        body (bytes): Raw HTML of the page
+        url (str): URL the page was fetched from
+        content_type (str): Content-Type header the page was served with
+        
+    Returns:
+        Dict: Extracted content with title, text, metadata and internal links
+    """
+    tree = LexborHTMLParser(_decode_body(body, content_type))
+    
+    tree.strip_tags(STRIPPED_TAGS)
+    
+    title = tree.css_first(TITLE_SELECTOR)
+    title_text = title.text(strip=True) if title else "No title found"
+
+    content_matches = tree.css(CONTENT_SELECTOR)
+    content_element = min(content_matches, key=_content_priority) if content_matches else None
+    
+    content_text = ""
+    if content_element:
+        content_text = content_element.text(separator=' ', strip=True)
+    
+    if not content_text:
+        body_node = tree.body
+        if body_node:
+            content_text = body_node.text(separator=' ', strip=True)
+    
+    meta_desc = tree.css_first(DESCRIPTION_SELECTOR)
+    description = (meta_desc.attributes.get('content') or '') if meta_desc else ''
+    
+
+    content_text = _WS_RE.sub(' ', content_text).strip()
+    # Words are now separated by exactly one space, so count them directly
+    # rather than splitting the text a second time
+    word_count = content_text.count(' ') + 1 if content_text else 0
+    
+    # Base result
+    result = {
+        'title': title_text,
+        'content': content_text[:5000],  # Limit content length
+        'description': description,
+        'url': url,
+        'word_count': word_count,
+        'status': 'success',
+        'internal_links': []
+    }
+    
+    internal_links = _extract_internal_links(tree, url)
+    
+    result['internal_links'] = internal_links
+    result['internal_links_count'] = len(internal_links)
+    
+    return result
+
+
 class ContentCrawler:
     def __init__(self, serper_api_key: str):
         """
@@ -27,6 +336,33 @@ class ContentCrawler:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        retry = Retry(
+            total=FETCH_ATTEMPTS - 1,
+            backoff_factor=RETRY_BACKOFF_BASE,
+            backoff_max=RETRY_BACKOFF_MAX,
+            backoff_jitter=RETRY_BACKOFF_BASE,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False
+        )
+        self.session.mount('http://', HTTPAdapter(max_retries=retry))
+        self.session.mount('https://', HTTPAdapter(max_retries=retry))
+        # Parsing is CPU-bound, so it runs in separate processes rather than
+        # threads to keep it off the GIL and the event loop. Created on first
+        # use, see _get_parse_pool().
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        # Consecutive failed requests per host; hosts are removed on success
+        self._host_failures: Dict[str, int] = {}
+        # Successfully crawled pages, keyed by canonical URL, so repeated
+        # crawls (e.g. across MCP tool calls) skip the fetch and parse
+        self._page_cache: OrderedDict[str, Tuple[float, Dict]] = OrderedDict()
+        # Page fetches currently running, keyed by canonical URL. They run on
+        # the crawler's own session, so they outlive the crawl that started
+        # them if that crawl is cancelled.
+        self._inflight_pages: Dict[str, asyncio.Task] = {}
+        self._fetch_session: Optional[aiohttp.ClientSession] = None
+        self._fetch_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._search_queue: Optional[asyncio.Queue] = None
+        self._search_worker: Optional[asyncio.Task] = None
     
     def search_related_topics(self, query: str, num_results: int = 10, 
                             country: str = 'us', language: str = 'en') -> Dict:
@@ -50,50 +386,258 @@ class ContentCrawler:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.serper_base_url,
                 headers=self.headers,
-                data=json.dumps(payload)
+                json=payload
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"Error searching with Serper API: {e}")
             return {}
     
-    def extract_internal_links(self, soup: BeautifulSoup, base_url: str, max_links: int = 10) -> List[str]:
+    async def _enqueue_search(self, query: str, num_results: int = 10, 
+                              country: str = 'us', language: str = 'en') -> Dict:
+        """
+        Search for content using Serper API, batched with concurrent searches
+        
+        Queries issued within SERPER_BATCH_WINDOW_MS of each other are sent
+        to Serper as a single batch request by _serper_worker.
+        
+        Args:
+            query (str): Search query
+            num_results (int): Number of results to return
+            country (str): Country code for search localization
+            language (str): Language code for search
+            
+        Returns:
+            Dict: Search results from Serper API
+        """
+        payload = {
+            'q': query,
+            'num': num_results,
+            'gl': country,
+            'hl': language
+        }
+        
+        loop = asyncio.get_running_loop()
+        worker = self._search_worker
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._search_queue = asyncio.Queue()
+            self._search_worker = loop.create_task(self._serper_worker(self._search_queue))
+        
+        future = loop.create_future()
+        await self._search_queue.put((payload, future))
+        return await future
+    
+    async def _serper_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Drain queued searches and send them to Serper in batches
+        
+        Args:
+            queue (asyncio.Queue): Queue of (payload, future) pairs
+        """
+        loop = asyncio.get_running_loop()
+        window = SERPER_BATCH_WINDOW_MS / 1000
+        
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=SERPER_TIMEOUT),
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
+        ) as session:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + window
+                while len(batch) < SERPER_MAX_BATCH:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                payloads = [payload for payload, _ in batch]
+                try:
+                    async with session.post(self.serper_base_url, json=payloads) as response:
+                        response.raise_for_status()
+                        results = await response.json(loads=orjson.loads)
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    logger.error(f"Error searching with Serper API: {str(e) or type(e).__name__}")
+                    results = []
+                
+                if not isinstance(results, list) or len(results) != len(batch):
+                    results = [{}] * len(batch)
+                
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+    
+    def extract_internal_links(self, tree: LexborHTMLParser, base_url: str, max_links: int = 10) -> List[str]:
         """
         Extract internal links from a webpage
         
         Args:
-            soup (BeautifulSoup): Parsed HTML content
+            tree (LexborHTMLParser): Parsed HTML content
             base_url (str): Base URL for resolving relative links
             max_links (int): Maximum number of internal links to extract
             
         Returns:
             List[str]: List of internal links
         """
-        base_domain = urlparse(base_url).netloc
-        internal_links = set()
+        return _extract_internal_links(tree, base_url, max_links)
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the parser process pool, starting it on first use
         
-        for link in soup.find_all('a', href=True):
-            href = link['href'].strip()
-            
-            if not href or href.startswith('#') or href.startswith('mailto:') or href.startswith('tel:'):
-                continue
-            
-            full_url = urljoin(base_url, href)
-            parsed_url = urlparse(full_url)
+        Returns:
+            ProcessPoolExecutor: Pool used to parse fetched pages
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        return self._parse_pool
+    
+    def _discard_parse_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Drop a broken parser pool so the next parse starts a new one
+        
+        Args:
+            pool (ProcessPoolExecutor): Pool that raised BrokenProcessPool
+        """
+        if self._parse_pool is pool:
+            self._parse_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def _open_fetch_session(self) -> aiohttp.ClientSession:
+        """
+        Return the session page fetches run on, opening it if needed
+        
+        A session is bound to the event loop it was created in, so a new one
+        is opened when called from a different loop.
+        
+        Returns:
+            aiohttp.ClientSession: Session for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._fetch_session
+        if session is not None and not session.closed and self._fetch_session_loop is loop:
+            return session
+        if session is not None and not session.closed:
+            if self._fetch_session_loop.is_running():
+                # Still open in another loop that is running; close it there
+                asyncio.run_coroutine_threadsafe(session.close(), self._fetch_session_loop)
+            else:
+                await session.close()
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_PER_HOST)
+        self._fetch_session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.session.headers['User-Agent']}
+        )
+        self._fetch_session_loop = loop
+        return self._fetch_session
+    
+    def close(self) -> None:
+        """
+        Shut down the parser process pool and close the HTTP session
+        
+        Blocks until the parser processes exit; use aclose() from async code.
+        """
+        if self._fetch_session is not None and self._fetch_session_loop.is_closed():
+            # Left behind by a finished event loop (e.g. at process exit)
+            asyncio.run(self._close_fetch_session())
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True, cancel_futures=True)
+            self._parse_pool = None
+        self.session.close()
+    
+    async def _close_fetch_session(self) -> None:
+        """
+        Close the page fetch session, if one is open
+        """
+        if self._fetch_session is not None:
+            await self._fetch_session.close()
+            self._fetch_session = None
+            self._fetch_session_loop = None
+    
+    async def aclose(self) -> None:
+        """
+        Close the page fetch session, then run close() in a thread
+        """
+        await self._close_fetch_session()
+        await asyncio.to_thread(self.close)
+    
+    def _cached_page(self, url: str) -> Optional[Tuple[Dict, float]]:
+        """
+        Look up a previously crawled page that has not expired
+        
+        Args:
+            url (str): URL of the page
             
-            if parsed_url.netloc == base_domain:
-                clean_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
-                if clean_url != base_url and clean_url not in internal_links:
-                    internal_links.add(clean_url)
-                    
-                    if len(internal_links) >= max_links:
-                        break
+        Returns:
+            Optional[Tuple[Dict, float]]: Copy of the cached result and the
+            time it was fetched, or None if not cached
+        """
+        key = _canonical_url(url)
+        cached = self._page_cache.get(key)
+        if cached is None:
+            return None
+        fetched_at, result = cached
+        if time.time() - fetched_at > PAGE_CACHE_TTL:
+            del self._page_cache[key]
+            return None
+        self._page_cache.move_to_end(key)
+        return {**result, 'url': url}, fetched_at
+    
+    def _cache_page(self, url: str, result: Dict, fetched_at: float) -> None:
+        """
+        Remember a successfully crawled page, evicting the least recently used
         
-        return list(internal_links)
+        Args:
+            url (str): URL of the page
+            result (Dict): Extracted content for the page
+            fetched_at (float): Time the page was fetched, as from time.time()
+        """
+        if result.get('status') != 'success':
+            return
+        key = _canonical_url(url)
+        self._page_cache[key] = (fetched_at, result)
+        self._page_cache.move_to_end(key)
+        if len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+    
+    def _forget_inflight_page(self, key: str, task: asyncio.Task) -> None:
+        """
+        Remove a finished page fetch from the in-flight table
+        
+        Args:
+            key (str): Canonical URL of the page
+            task (asyncio.Task): The finished fetch task
+        """
+        if self._inflight_pages.get(key) is task:
+            del self._inflight_pages[key]
+    
+    def _error_result(self, url: str, status: str) -> Dict:
+        """
+        Build the result returned for a page that could not be crawled
+        
+        Args:
+            url (str): URL that failed
+            status (str): Error status to report
+            
+        Returns:
+            Dict: Empty content result carrying the error status
+        """
+        return {
+            'title': '',
+            'content': '',
+            'description': '',
+            'url': url,
+            'word_count': 0,
+            'status': status,
+            'internal_links': []
+        }
     
     def extract_content_from_url(self, url: str, timeout: int = 10) -> Dict[str, str]:
         """
@@ -102,118 +646,143 @@ class ContentCrawler:
         Args:
             url (str): URL to extract content from
             timeout (int): Request timeout in seconds
-            crawl_internal (bool): Whether to crawl internal links
-            max_internal_links (int): Maximum number of internal links to crawl
             
         Returns:
             Dict: Extracted content with title, text, metadata, and internal links content
         """
         try:
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
+            cached = self._cached_page(url)
+            if cached is not None:
+                return cached[0]
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                if not _is_html(content_type):
+                    return self._error_result(url, f'skipped: non-HTML content ({content_type})')
+                body = response.raw.read(MAX_BODY_BYTES, decode_content=True)
             
-            for script in soup(["script", "style"]):
-                script.decompose()
+            result = _parse_html(body, url, content_type)
+            self._cache_page(url, result, time.time())
+            return result
             
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No title found"
-
-            content_selectors = [
-                'article', 'main', '[role="main"]', 
-                '.content', '.post-content', '.entry-content',
-                '.article-content', '.post-body'
-            ]
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching content from {url}: {e}")
+            return self._error_result(url, f'error: {str(e)}')
+        except Exception as e:
+            logger.error(f"Error parsing content from {url}: {e}")
+            return self._error_result(url, f'parsing error: {str(e)}')
+    
+    async def _afetch_body(self, session: aiohttp.ClientSession, url: str, timeout: int) -> Tuple[str, Optional[bytes]]:
+        """
+        Download the (size-capped) body of an HTML page
+        
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            url (str): URL to fetch
+            timeout (int): Request timeout in seconds
             
-            content_text = ""
-            for selector in content_selectors:
-                content_element = soup.select_one(selector)
-                if content_element:
-                    content_text = content_element.get_text(separator=' ', strip=True)
+        Returns:
+            Tuple[str, Optional[bytes]]: Content-Type and body, or None as
+            the body when the response is not HTML
+        """
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            if not _is_html(content_type):
+                return content_type, None
+            # Collect chunks as they arrive and join once at the end, rather
+            # than growing a buffer and copying it again to trim it
+            chunks = []
+            remaining = MAX_BODY_BYTES
+            async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+                chunks.append(chunk[:remaining])
+                remaining -= len(chunk)
+                if remaining <= 0:
                     break
+            return content_type, b''.join(chunks)
+    
+    async def _afetch(self, session: aiohttp.ClientSession, url: str, timeout: int = 10) -> Dict:
+        """
+        Asynchronously fetch a URL and parse it in the worker process pool
+        
+        Transient failures (connection errors, timeouts, 429 and 5xx) are
+        retried with jittered exponential backoff. Hosts that keep failing
+        are backed off further before each new request.
+        
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            url (str): URL to extract content from
+            timeout (int): Request timeout in seconds
             
-            if not content_text:
-                body = soup.find('body')
-                if body:
-                    content_text = body.get_text(separator=' ', strip=True)
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            description = meta_desc.get('content', '') if meta_desc else ''
-            
-
-            content_text = ' '.join(content_text.split())
+        Returns:
+            Dict: Extracted content, or an error result
+        """
+        host = urlparse(url).netloc
+        failures = self._host_failures.get(host, 0)
+        if failures >= HOST_FAILURE_THRESHOLD:
+            await asyncio.sleep(min(2 ** failures, MAX_HOST_BACKOFF))
+        
+        for attempt in range(FETCH_ATTEMPTS):
             try:
-                content_text = content_text.encode('utf-8', errors='ignore').decode('utf-8')
+                content_type, body = await self._afetch_body(session, url, timeout)
+                self._host_failures.pop(host, None)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+                retryable = _is_transient(e)
+                if not retryable or attempt == FETCH_ATTEMPTS - 1:
+                    # One failed request counts once, however many attempts
+                    # it took
+                    if retryable:
+                        self._host_failures[host] = self._host_failures.get(host, 0) + 1
+                    logger.error(f"Error fetching content from {url}: {error}")
+                    return self._error_result(url, f'error: {error}')
+                backoff = random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** attempt))
+                logger.warning(f"Retrying {url} in {backoff:.2f}s after error: {error}")
+                await asyncio.sleep(backoff)
             except Exception as e:
-                logger.warning(f"Encoding issue with content at {url}: {e}")
-                content_text = content_text.encode('utf-8', errors='replace').decode('utf-8')
-
-            
-            # Base result
-            result = {
-                'title': title_text,
-                'content': content_text[:5000],  # Limit content length
-                'description': description,
-                'url': url,
-                'word_count': len(content_text.split()),
-                'status': 'success',
-                'internal_links': []
-            }
-            
-            internal_links = self.extract_internal_links(soup, url)
-            
-            result['internal_links'] = internal_links
-            result['internal_links_count'] = len(internal_links)
-            
-            return result
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching content from {url}: {e}")
-            return {
-                'title': '',
-                'content': '',
-                'description': '',
-                'url': url,
-                'word_count': 0,
-                'status': f'error: {str(e)}',
-                'internal_links': []
-            }
+                # e.g. malformed URLs or hosts IDNA cannot encode
+                logger.error(f"Error fetching content from {url}: {e}")
+                return self._error_result(url, f'error: {str(e)}')
+        
+        if body is None:
+            return self._error_result(url, f'skipped: non-HTML content ({content_type})')
+        
+        pool = self._get_parse_pool()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, _parse_html, body, url, content_type)
+        except BrokenProcessPool as e:
+            # A worker died (e.g. OOM); the pool is unusable from now on, so
+            # drop it and let the next page start a fresh one
+            logger.error(f"Parser process died while parsing {url}: {e}")
+            self._discard_parse_pool(pool)
+            return self._error_result(url, f'parsing error: {str(e)}')
         except Exception as e:
             logger.error(f"Error parsing content from {url}: {e}")
-            return {
-                'title': '',
-                'content': '',
-                'description': '',
-                'url': url,
-                'word_count': 0,
-                'status': f'parsing error: {str(e)}',
-                'internal_links': []
-            }
+            return self._error_result(url, f'parsing error: {str(e)}')
     
-    def crawl_related_content(self, query: str, max_results: int = 5, 
-                            delay: float = 1.0) -> List[Dict]:
+    async def acrawl_related_content(self, query: str, max_results: int = 5, 
+                                     delay: float = 1.0) -> List[Dict]:
         """
-        Main method to crawl content for related topics
+        Crawl content for related topics, fetching all result pages concurrently
         
         Args:
             query (str): Search query
             max_results (int): Maximum number of URLs to crawl
-            delay (float): Delay between requests in seconds
-            crawl_internal_links (bool): Whether to crawl internal links from each site
-            max_internal_per_site (int): Maximum internal links to crawl per site
+            delay (float): Minimum delay between requests to the same host in seconds
             
         Returns:
             List[Dict]: List of crawled content with metadata
         """
         logger.info(f"Starting content crawl for query: '{query}'")
-        search_results = self.search_related_topics(query, max_results)
+        search_results = await self._enqueue_search(query, max_results)
         
         if not search_results or 'organic' not in search_results:
             logger.error("No search results found")
             return []
         
-        crawled_content = []
         urls_to_crawl = []
         
         for result in search_results['organic'][:max_results]:
@@ -224,29 +793,87 @@ class ContentCrawler:
                 'position': result.get('position', 0)
             })
         
-        for i, url_info in enumerate(urls_to_crawl):
-            logger.info(f"Crawling {i+1}/{len(urls_to_crawl)}: {url_info['url']}")
+        # Politeness: at most MAX_PER_HOST requests in flight per host, and
+        # request starts to the same host spaced by `delay` seconds.
+        host_locks = defaultdict(lambda: asyncio.Semaphore(MAX_PER_HOST))
+        host_last_hit = {}
+        loop = asyncio.get_running_loop()
+        
+        async def fetch(session, i, url):
+            cached = self._cached_page(url)
+            if cached is not None:
+                logger.info(f"Using cached content {i+1}/{len(urls_to_crawl)}: {url}")
+                return cached
             
-            content = self.extract_content_from_url(
-                url_info['url'], 
-
-            )
+            host = urlparse(url).netloc
+            async with host_locks[host]:
+                wait = host_last_hit.get(host, float('-inf')) + delay - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                host_last_hit[host] = loop.time()
+                logger.info(f"Crawling {i+1}/{len(urls_to_crawl)}: {url}")
+                content = await self._afetch(session, url)
+            fetched_at = time.time()
+            self._cache_page(url, content, fetched_at)
+            return content, fetched_at
+        
+        async def crawl(session, i, url_info):
+            # Each canonical URL is fetched by a single task, shared by
+            # duplicate search results and by concurrent crawls
+            try:
+                key = _canonical_url(url_info['url'])
+                task = self._inflight_pages.get(key)
+                if task is None or task.get_loop() is not loop:
+                    task = asyncio.ensure_future(fetch(session, i, url_info['url']))
+                    self._inflight_pages[key] = task
+                    task.add_done_callback(partial(self._forget_inflight_page, key))
+                content, fetched_at = await asyncio.shield(task)
+            except Exception as e:
+                # One bad search result must not sink the whole crawl
+                logger.error(f"Error crawling {url_info['url']}: {e}")
+                content, fetched_at = self._error_result(url_info['url'], f'error: {str(e)}'), time.time()
             
-            combined_content = {
+            return {
                 **content,
+                'url': url_info['url'],
                 'search_title': url_info['title'],
                 'search_snippet': url_info['snippet'],
                 'search_position': url_info['position'],
-                'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S')
+                'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(fetched_at))
             }
-            
-            crawled_content.append(combined_content)
-            
-            if i < len(urls_to_crawl) - 1:
-                time.sleep(delay)
+        
+        session = await self._open_fetch_session()
+        crawled_content = await asyncio.gather(
+            *[crawl(session, i, url_info) for i, url_info in enumerate(urls_to_crawl)]
+        )
         
         logger.info(f"Crawling completed. {len(crawled_content)} pages processed.")
         return crawled_content
+    
+    def crawl_related_content(self, query: str, max_results: int = 5, 
+                            delay: float = 1.0) -> List[Dict]:
+        """
+        Main method to crawl content for related topics
+        
+        Blocking wrapper around acrawl_related_content; use the async method
+        directly when already running inside an event loop.
+        
+        Args:
+            query (str): Search query
+            max_results (int): Maximum number of URLs to crawl
+            delay (float): Minimum delay between requests to the same host in seconds
+            
+        Returns:
+            List[Dict]: List of crawled content with metadata
+        """
+        async def crawl_and_close() -> List[Dict]:
+            # The event loop ends with this call, and its session with it
+            try:
+                return await self.acrawl_related_content(query, max_results, delay)
+            finally:
+                await self._close_fetch_session()
+        
+        return asyncio.run(crawl_and_close())
     # def save_results(self, results: List[Dict], filename: str = None):
     #     """
     #     Save crawled results to JSON file
@@ -1,11 +1,88 @@
 import asyncio
 import os
+import aiohttp
 from firecrawl import AsyncFirecrawlApp
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+
+
+class PooledFirecrawlApp(AsyncFirecrawlApp):
+    """
+    AsyncFirecrawlApp that sends requests through a shared aiohttp session.
+
+    The SDK opens a new ClientSession (and so a new TCP/TLS connection) for
+    every request. When `session` is set, requests reuse its connection
+    pool instead; otherwise the SDK behaviour is unchanged.
+    """
+    session: Optional[aiohttp.ClientSession] = None
+
+    async def _async_request(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]] = None,
+            retries: int = 3,
+            backoff_factor: float = 0.5) -> Dict[str, Any]:
+        # Mirrors AsyncFirecrawlApp._async_request from firecrawl 2.7.0 with
+        # the per-call ClientSession swapped for the shared one. This relies
+        # on a private SDK method, hence the <3 pin in pyproject.toml; check
+        # it against the SDK source before raising that bound.
+        if self.session is None or self.session.closed:
+            return await super()._async_request(method, url, headers, data, retries, backoff_factor)
+
+        for attempt in range(retries):
+            try:
+                async with self.session.request(
+                    method=method, url=url, headers=headers, json=data
+                ) as response:
+                    if response.status == 502:
+                        await asyncio.sleep(backoff_factor * (2 ** attempt))
+                        continue
+                    if response.status >= 300:
+                        await self._handle_error(response, f"make {method} request")
+                    return await response.json()
+            except aiohttp.ClientError as e:
+                if attempt == retries - 1:
+                    raise e
+                await asyncio.sleep(backoff_factor * (2 ** attempt))
+        raise Exception("Max retries exceeded")
+
 
 class URLScraper:
-    def __init__(self, api_key: str):
-        self.app = AsyncFirecrawlApp(api_key=api_key)
+    def __init__(self, api_key: str, max_concurrent: int = 10):
+        self.app = PooledFirecrawlApp(api_key=api_key)
+        self.max_concurrent = max_concurrent
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def open(self) -> None:
+        """
+        Open the shared HTTP session if it is not already open.
+        
+        The session stays open across scrape_multiple_urls calls so repeated
+        tool invocations reuse warm connections; call close() to release it.
+        A session is bound to the event loop it was created in, so a new one
+        is opened when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self.app.session
+        if session is not None and not session.closed and self._session_loop is loop:
+            return
+        if session is not None and not session.closed and self._session_loop.is_running():
+            # Still open in another loop that is running; close it there
+            asyncio.run_coroutine_threadsafe(session.close(), self._session_loop)
+        self.app.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrent, keepalive_timeout=30)
+        )
+        self._session_loop = loop
+    
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session.
+        """
+        if self.app.session is not None:
+            await self.app.session.close()
+            self.app.session = None
+            self._session_loop = None
     
     async def scrape_url(self, url: str, timeout: int = 30) -> Dict:
         """
@@ -45,22 +122,23 @@ class URLScraper:
                 'error': str(e)
             }
     
-    async def scrape_multiple_urls(self, urls: List[str], timeout: int = 30, max_concurrent: int = 3) -> List[Dict]:
+    async def scrape_multiple_urls(self, urls: List[str], timeout: int = 30, max_concurrent: Optional[int] = None) -> List[Dict]:
         """
-        Scrape multiple URLs with concurrency limit and timeout.
+        Scrape multiple URLs with concurrency limit and per-URL timeout.
+        
+        Each URL gets its own timeout, so one slow page does not use up the
+        budget of the others; whatever finished is always returned.
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        if not urls:
+            return []
+        if max_concurrent is None:
+            max_concurrent = self.max_concurrent
+        semaphore = asyncio.Semaphore(min(max_concurrent, len(urls)))
         
         async def scrape_with_semaphore(url):
             async with semaphore:
                 return await self.scrape_url(url, timeout)
         
-        try:
-            tasks = [scrape_with_semaphore(url) for url in urls]
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=timeout * len(urls)  
-            )
-            return results
-        except asyncio.TimeoutError:
-            return [{'url': url, 'success': False, 'error': 'Overall operation timeout'} for url in urls]
\ No newline at end of file
+        await self.open()
+        tasks = [scrape_with_semaphore(url) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
@@ -3,6 +3,7 @@ from dotenv import load_dotenv
 import httpx
 import json
 import asyncio
+import atexit
 from typing import List
 import os
 from crawler import ContentCrawler
@@ -16,6 +17,13 @@ crawler = ContentCrawler(os.getenv("SERPER_API_KEY"))
 crawler2 = URLScraper(os.getenv("FIRECRAWL_API_KEY"))
 
 
+@atexit.register
+def shutdown() -> None:
+  """Release the crawlers' HTTP sessions and parser processes at process exit."""
+  asyncio.run(crawler2.close())
+  crawler.close()
+
+
 @mcp.tool()  
 async def get_content(topic: str) -> str:
   """
@@ -39,7 +47,7 @@ async def get_content(topic: str) -> str:
       # Returns the full text from the first two web pages found on the topic "Introduction to Machine Learning".
   """
   try:
-    results = crawler.crawl_related_content(topic, max_results=3, delay=1.0)
+    results = await crawler.acrawl_related_content(topic, max_results=3, delay=1.0)
     
     text = """you got the  content from the web and internal links 
     you need to decide which internal links have useful content which is helpful to explain the topic to the user